@@ -390,10 +390,8 @@ class Base(object):
                 for r in self.repos.iter_enabled():
                     try:
                         self._add_repo_to_sack(r)
-                        if r._repo.getTimestamp() > mts:
-                            mts = r._repo.getTimestamp()
-                        if r._repo.getAge() < age:
-                            age = r._repo.getAge()
+                        mts = max(mts, r._repo.getTimestamp())
+                        age = min(age, r._repo.getAge())
                         logger.debug(_("%s: using metadata from %s."), r.id,
                                      dnf.util.normalize_time(
                                          r._repo.getMaxTimestamp()))
@@ -925,6 +925,10 @@ class Output(object):
                 printed_match = True
             else:
                 key = _("Provide    : %s")
+                if any((char in item) for char in '=<>'):
+                    item_new = item.split()[0]
+                else:
+                    item_new = item
                 for provide in po.provides:
                     provide = str(provide)
                     if fnmatch.fnmatch(provide, item):
@@ -932,11 +936,6 @@ class Output(object):
                         printed_match = True
                     else:
                         first_provide = provide.split()[0]
-                        possible = set('=<>')
-                        if any((char in possible) for char in item):
-                            item_new = item.split()[0]
-                        else:
-                            item_new = item
                         if fnmatch.fnmatch(first_provide, item_new):
                             print_highlighted_key_item(
                                 key, provide, printed_match, can_overflow=False)
@@ -60,11 +60,10 @@ class RepoReader(object):
         invalid = dnf.repo.repo_id_invalid(substituted_id)
         if invalid is not None:
             if substituted_id != id_:
-                msg = _("Bad id for repo: {} ({}), byte = {} {}").format(substituted_id, id_,
-                                                                         substituted_id[invalid],
-                                                                         invalid)
+                msg = _("Bad id for repo: {} ({}), character = {} {}").format(
+                    substituted_id, id_, substituted_id[invalid], invalid)
             else:
-                msg = _("Bad id for repo: {}, byte = {} {}").format(id_, id_[invalid], invalid)
+                msg = _("Bad id for repo: {}, character = {} {}").format(id_, id_[invalid], invalid)
             raise dnf.exceptions.ConfigError(msg)
 
         repo = dnf.repo.Repo(substituted_id, self.conf)
@@ -38,6 +38,8 @@ logger = logging.getLogger("dnf")
 
 
 class DeltaPayload(dnf.repo.PackagePayload):
+    __slots__ = ('delta_info', 'delta')
+
     def __init__(self, delta_info, delta, pkg, progress):
         super(DeltaPayload, self).__init__(pkg, progress)
         self.delta_info = delta_info
@@ -57,7 +59,7 @@ class DeltaPayload(dnf.repo.PackagePayload):
         ctype = hawkey.chksum_name(ctype)
         chksum = hexlify(csum).decode()
 
-        ctype_code = libdnf.repo.PackageTarget.checksumType(ctype)
+        ctype_code = dnf.repo._checksum_type_code(ctype)
         if ctype_code == libdnf.repo.PackageTarget.ChecksumType_UNKNOWN:
             logger.warning(_("unsupported checksum type: %s"), ctype)
 
@@ -243,7 +243,7 @@ class Package(hawkey.Package):
         if self._from_cmdline:
             return self.location
         loc = self.location
-        if self.repo._repo.isLocal() and self.baseurl and self.baseurl.startswith('file://'):
+        if self.repo._local and self.baseurl and self.baseurl.startswith('file://'):
             return os.path.join(self.baseurl, loc.lstrip("/"))[7:]
         if not self._is_local_pkg():
             loc = os.path.basename(loc)
@@ -263,11 +263,11 @@ class Package(hawkey.Package):
         if self.repoid == "@System":
             return True
         return self._from_cmdline or \
-            (self.repo._repo.isLocal() and (not self.baseurl or self.baseurl.startswith('file://')))
+            (self.repo._local and (not self.baseurl or self.baseurl.startswith('file://')))
 
     @property
     def pkgdir(self):
-        if (self.repo._repo.isLocal() and not self._is_local_pkg()):
+        if (self.repo._local and not self._is_local_pkg()):
             return self.repo.cache_pkgdir()
         else:
             return self.repo.pkgdir
@@ -54,6 +54,8 @@ _REPOID_CHARS = string.ascii_letters + string.digits + '-_.:'
 # Regex pattern that matches a repo cachedir and captures the repo ID
 _CACHEDIR_RE = r'(?P<repoid>[%s]+)\-[%s]{16}' % (re.escape(_REPOID_CHARS),
                                                  string.hexdigits)
+# Regex pattern that matches the first char not allowed in a repo ID
+_INVALID_REPOID_RE = re.compile(r'[^%s]' % re.escape(_REPOID_CHARS))
 
 # Regex patterns matching any filename that is repo-specific cache data of a
 # particular type.  The filename is expected to not contain the base cachedir
@@ -71,8 +73,21 @@ logger = logging.getLogger("dnf")
 def repo_id_invalid(repo_id):
     # :api
     """Return index of an invalid character in the repo ID (if present)."""
-    first_invalid = libdnf.repo.Repo.verifyId(repo_id)
-    return None if first_invalid < 0 else first_invalid
+    match = _INVALID_REPOID_RE.search(repo_id)
+    return None if match is None else match.start()
+
+
+_checksum_type_codes = {}
+
+
+def _checksum_type_code(ctype):
+    """Return the PackageTarget checksum type constant for the ctype name."""
+    try:
+        return _checksum_type_codes[ctype]
+    except KeyError:
+        code = libdnf.repo.PackageTarget.checksumType(ctype)
+        _checksum_type_codes[ctype] = code
+        return code
 
 
 def _pkg2payload(pkg, progress, *factories):
@@ -88,6 +103,9 @@ def _download_payloads(payloads, drpm):
     def _download_sort_key(payload):
         return not hasattr(payload, 'delta')
 
+    for pkgdir in set(pload.pkgdir for pload in payloads):
+        dnf.util.ensure_dir(pkgdir)
+
     drpm.err.clear()
     targets = [pload._librepo_target()
                for pload in sorted(payloads, key=_download_sort_key)]
@@ -173,12 +191,19 @@ class _NullKeyImport(dnf.callback.KeyImport):
 class Metadata(object):
     def __init__(self, repo):
         self._repo = repo
+        self._mirrors = None
 
     @property
     def fresh(self):
         # :api
         return self._repo.fresh()
 
+    @property
+    def mirrors(self):
+        if self._mirrors is None:
+            self._mirrors = tuple(self._repo.getMirrors())
+        return self._mirrors
+
 
 class PackageTargetCallbacks(libdnf.repo.PackageTargetCB):
     def __init__(self, package_pload):
@@ -199,6 +224,8 @@ class PackageTargetCallbacks(libdnf.repo.PackageTargetCB):
 
 
 class PackagePayload(dnf.callback.Payload):
+    __slots__ = ('progress', 'callbacks', 'pkg')
+
     def __init__(self, pkg, progress):
         super(PackagePayload, self).__init__(progress)
         self.callbacks = PackageTargetCallbacks(self)
@@ -231,13 +258,16 @@ class PackagePayload(dnf.callback.Payload):
     def _full_size(self):
         return self.download_size
 
+    @property
+    def pkgdir(self):
+        """Directory the payload is downloaded to, ensured by the caller."""
+        return self.pkg.pkgdir
+
     def _librepo_target(self):
         pkg = self.pkg
-        pkgdir = pkg.pkgdir
-        dnf.util.ensure_dir(pkgdir)
 
         target_dct = {
-            'dest': pkgdir,
+            'dest': self.pkgdir,
             'resume': True,
             'cbdata': self,
             'progresscb': self._progress_cb,
@@ -255,6 +285,7 @@ class PackagePayload(dnf.callback.Payload):
 
 
 class RPMPayload(PackagePayload):
+    __slots__ = ()
 
     def __str__(self):
         return os.path.basename(self.pkg.location)
@@ -262,7 +293,7 @@ class RPMPayload(PackagePayload):
     def _target_params(self):
         pkg = self.pkg
         ctype, csum = pkg.returnIdSum()
-        ctype_code = libdnf.repo.PackageTarget.checksumType(ctype)
+        ctype_code = _checksum_type_code(ctype)
         if ctype_code == libdnf.repo.PackageTarget.ChecksumType_UNKNOWN:
             logger.warning(_("unsupported checksum type: %s"), ctype)
 
@@ -281,6 +312,7 @@ class RPMPayload(PackagePayload):
 
 
 class RemoteRPMPayload(PackagePayload):
+    __slots__ = ('remote_location', 'remote_size', 'conf', 'pkgdir', 'local_path')
 
     def __init__(self, remote_location, conf, progress):
         super(RemoteRPMPayload, self).__init__("unused_object", progress)
@@ -319,6 +351,8 @@ class RemoteRPMPayload(PackagePayload):
 
 
 class MDPayload(dnf.callback.Payload):
+    __slots__ = ('_text', '_download_size', 'fastest_mirror_running', 'mirror_failures',
+                 '_progress')
 
     def __init__(self, progress):
         super(MDPayload, self).__init__(progress)
@@ -432,6 +466,7 @@ class Repo(dnf.conf.RepoConf):
         self._repo.setCallbacks(self._callbacks)
 
         self._pkgdir = None
+        self._local_cache = None
         self._key_import = _NullKeyImport()
         self.metadata = None  # :api
         self._repo.setSyncStrategy(self.DEFAULT_SYNC)
@@ -455,10 +490,17 @@ class Repo(dnf.conf.RepoConf):
     def repofile(self, value):
         self._repo.setRepoFilePath(value)
 
+    @property
+    def _local(self):
+        # depends only on baseurl, metalink and mirrorlist, see _set_value()
+        if self._local_cache is None:
+            self._local_cache = self._repo.isLocal()
+        return self._local_cache
+
     @property
     def pkgdir(self):
         # :api
-        if self._repo.isLocal():
+        if self._local:
             return dnf.util.strip_prefix(self.baseurl[0], 'file://')
         return self.cache_pkgdir()
 
@@ -493,6 +535,19 @@ class Repo(dnf.conf.RepoConf):
     def __setattr__(self, name, value):
         super(Repo, self).__setattr__(name, value)
 
+    def _set_value(self, name, value, priority=dnf.conf.PRIO_RUNTIME):
+        super(Repo, self)._set_value(name, value, priority)
+        if name in ('baseurl', 'metalink', 'mirrorlist'):
+            self._local_cache = None
+
+    def _populate(self, parser, section, filename, priority=dnf.conf.PRIO_DEFAULT):
+        super(Repo, self)._populate(parser, section, filename, priority)
+        self._local_cache = None
+
+    def _configure_from_options(self, opts):
+        super(Repo, self)._configure_from_options(opts)
+        self._local_cache = None
+
     def disable(self):
         # :api
         self._repo.disable()
@@ -651,7 +706,7 @@ class Repo(dnf.conf.RepoConf):
         if not location:
             return None
 
-        mirrors = self._repo.getMirrors()
+        mirrors = self.metadata.mirrors if self.metadata else self._repo.getMirrors()
         if mirrors:
             return schemes_filter(mirrors)
         elif self.baseurl:
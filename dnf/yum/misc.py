@@ -108,8 +108,9 @@ class Checksums(object):
 
     def update(self, data):
         self._len += len(data)
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
         for sumalgo in self._sumalgos:
-            data = data.encode('utf-8') if isinstance(data, unicode) else data
             sumalgo.update(data)
 
     def read(self, fo, size=2**16):
@@ -150,6 +151,15 @@ class Checksums(object):
 def get_default_chksum_type():
     return _default_checksums[0]
 
+def _advise_sequential(fo):
+    """Hint the kernel that fo is read once from start to end."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fo.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
 def checksum(sumtype, file, CHUNK=2**16, datasize=None):
     """takes filename, hand back Checksum of it
        sumtype = md5 or sha/sha1/sha256/sha512 (note sha == sha1)
@@ -161,6 +171,7 @@ def checksum(sumtype, file, CHUNK=2**16, datasize=None):
     if isinstance(file, basestring):
         try:
             with open(file, 'rb', CHUNK) as fo:
+                _advise_sequential(fo)
                 return checksum(sumtype, fo, CHUNK, datasize)
         except (IOError, OSError):
             raise MiscError('Error opening file for checksum: %s' % file)
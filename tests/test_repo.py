@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2012-2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import dnf.conf
+import dnf.repo
+
+import tests.support
+
+
+class RepoFunctionsTest(tests.support.TestCase):
+
+    def test_repo_id_invalid(self):
+        self.assertIsNone(dnf.repo.repo_id_invalid('R_e-p.o:1'))
+        self.assertEqual(dnf.repo.repo_id_invalid('R_e p'), 3)
+        self.assertEqual(dnf.repo.repo_id_invalid('foo/bar'), 3)
+
+
+class RepoTest(tests.support.TestCase):
+
+    def test_local_follows_baseurl(self):
+        repo = dnf.repo.Repo('r', tests.support.FakeConf())
+        repo.baseurl = ['file:///tmp/r']
+        self.assertTrue(repo._local)
+        self.assertEqual(repo.pkgdir, '/tmp/r')
+        repo.baseurl = ['http://example.com/r']
+        self.assertFalse(repo._local)
+        repo._set_value('baseurl', ['file:///tmp/r'], dnf.conf.PRIO_COMMANDLINE)
+        self.assertTrue(repo._local)